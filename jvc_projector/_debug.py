@@ -0,0 +1,39 @@
+"""
+Debug helpers, kept out of jvc_projector.py as they are only needed on demand
+"""
+
+from jvc_projector import commands
+from jvc_projector.commands import ACKs, Footer, Header, Commands, Enum
+
+# print_commands listings, computed once at import
+_SUPPORTED_COMMANDS = tuple(
+    sorted(
+        command.name
+        for command in Commands
+        if command.name not in {"power", "current_output", "info"}
+    )
+)
+_SUPPORTED_PARAM_CLASSES = tuple(
+    (name, tuple(option.name for option in obj))
+    for name, obj in sorted(vars(commands).items())
+    if isinstance(obj, type)
+    and issubclass(obj, Enum)
+    and obj not in {Commands, ACKs, Footer, Enum, Header}
+)
+
+
+def print_commands() -> None:
+    """
+    Print out all supported commands
+    """
+    print("Currently Supported Commands:")
+    for command in _SUPPORTED_COMMANDS:
+        print(f"\t{command}")
+
+    print("\n")
+    # Print all options
+    print("Currently Supported Parameters:")
+    for name, options in _SUPPORTED_PARAM_CLASSES:
+        print(name)
+        for option in options:
+            print(f"\t{option}")
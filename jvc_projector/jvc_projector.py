@@ -2,19 +2,26 @@
 Implements the JVC protocol
 """
 
+import functools
 import logging
 import math
+import random
+import errno
 from typing import Union
 import threading
+import time
+import asyncio
 import socket
+import select
 import hashlib
 from jvc_projector.commands import (
     ACKs,
     Footer,
     Header,
     Commands,
-    PowerStates,
     Enum,
+    PowerStates,
+    PowerModes,
     LowLatencyModes,
     PJ_ACK,
     PJ_REQ,
@@ -23,20 +30,292 @@ from jvc_projector.commands import (
 )
 import jvc_projector.errors
 
+_LOG = logging.getLogger(__name__)
+
+# Enum .value reads hoisted out of the per-command paths
+_HDR_REF = Header.reference.value
+_HDR_OP = Header.operation.value
+_PJ_UNIT = Header.pj_unit.value
+_FOOTER = Footer.close.value
+# every ack is <ack><unit><command ack><footer>, only the command ack varies
+_ACK_PREFIX = Header.ack.value + _PJ_UNIT
+# full ack frame the projector sends back, keyed by the 2 byte ack
+_ACK_VALUES: dict[bytes, bytes] = {
+    ack.value: _ACK_PREFIX + ack.value + _FOOTER for ack in ACKs
+}
+# a reference response is @ <unit> <2 byte ack> <payload> <footer>
+_RESPONSE_PAYLOAD = slice(len(Header.response.value) + len(_PJ_UNIT) + 2, -len(_FOOTER))
+# complete reference frames, the get_* methods always send the same bytes
+_REF_COMMANDS: dict[str, bytes] = {
+    command.name: b"".join((_HDR_REF, _PJ_UNIT, command.value[0], _FOOTER))
+    for command in Commands
+    if isinstance(command.value, tuple)
+}
+# exec_command table: command name -> (command bytes, option name -> bytes, ack),
+# the option map is None for commands that take a raw value
+_COMMAND_MAP: dict[str, tuple[bytes, Union[dict[str, bytes], None], ACKs]] = {
+    command.name: (
+        command.value[0],
+        (
+            {
+                name: option.value
+                for name, option in command.value[1].__members__.items()
+            }
+            if isinstance(command.value[1], type) and issubclass(command.value[1], Enum)
+            else None
+        ),
+        command.value[2],
+    )
+    for command in Commands
+    if isinstance(command.value, tuple)
+}
+# get_* table: command name -> (ack, payload -> option name), the option map
+# is None for commands that return a raw value instead of an Enum option
+_QUERIES: dict[str, tuple[ACKs, Union[dict[bytes, str], None]]] = {
+    command.name: (
+        command.value[2],
+        (
+            {option.value: option.name for option in command.value[1]}
+            if isinstance(command.value[1], type) and issubclass(command.value[1], Enum)
+            else None
+        ),
+    )
+    for command in Commands
+    if isinstance(command.value, tuple)
+}
+_MODEL_REQUEST = b"".join((_HDR_REF, _PJ_UNIT, Commands.get_model.value, _FOOTER))
+_INFO_REQUEST = b"".join((_HDR_OP, _PJ_UNIT, Commands.info.value, _FOOTER))
+# model_map keyed by the raw model code bytes
+_MODEL_BY_CODE = {code.encode(): family for code, family in model_map.items()}
+
+# socket errors that do not mean the connection is dead
+_TRANSIENT_ERRNOS = frozenset((errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR))
+
+# keepalive timings in seconds, see JVCProjector._enable_keepalive. A dead
+# projector is dropped after idle + interval, about 40s: one unanswered probe.
+# On linux TCP_USER_TIMEOUT below ends the connection at the first unanswered
+# probe whatever TCP_KEEPCNT says, the count of 1 makes other platforms match
+_KEEPALIVE_IDLE = 30
+_KEEPALIVE_INTERVAL = 10
+_KEEPALIVE_COUNT = 1
+# reconnect backoff in seconds, doubles per failed attempt up to the cap
+_RECONNECT_MIN_DELAY = 0.5
+_RECONNECT_MAX_DELAY = 30
+# seconds sent data may go unacked before the kernel drops the connection
+_USER_TIMEOUT = 5
+# seconds _drain waits for the tail of a stray frame that is still in flight
+_DRAIN_GRACE = 0.05
+# error message for a read timeout, both clients drop the connection on it
+_TIMED_OUT = "Timed out waiting for the projector"
+
+# power state byte -> name, avoids an Enum value lookup per poll
+_POWER_STATE_BY_BYTES: dict[bytes, str] = {
+    mode.value: mode.name for mode in Commands.power.value[1]
+}
+_POWER_ON_NAME = PowerStates.on.name
+_LL_ON_NAME = LowLatencyModes.on.name
+# attributes the projector only reports while on, asking in standby just times out
+_NEEDS_POWER = frozenset(
+    (
+        "hdr_processing",
+        "hdr_level",
+        "hdr_data",
+        "theater_optimizer",
+        "content_type",
+        "content_type_trans",
+        "laser_mode",
+        "laser_value",
+        "laser_power",
+        "source_display",
+    )
+)
+# _get_power_state decodes through PowerModes, standby reads as off
+_POWERED_DOWN = frozenset((PowerModes.off.name, PowerModes.cooling.name))
+# seconds a standby/cooling power state is trusted to skip the queries above
+_POWER_STATE_MAX_AGE = 5
+# what AsyncJVCProjector.refresh_all polls after power by default. HDR only
+# attributes (hdr_processing, theater_optimizer) are left out, they time out
+# on SDR content and each timeout costs a reconnect
+_POLL_ATTRIBUTES = (
+    "low_latency",
+    "picture_mode",
+    "installation_mode",
+    "input_mode",
+    "mask",
+    "laser_mode",
+    "eshift_mode",
+    "color_mode",
+    "input_level",
+    "content_type",
+    "content_type_trans",
+    "hdr_level",
+    "hdr_data",
+    "laser_power",
+    "aspect_ratio",
+    "anamorphic",
+    "source_status",
+    "source_display",
+)
+
+
+def _decimal_to_signed_hex(number: int) -> bytes:
+    # Convert the decimal value to signed 2-byte hexadecimal
+    hex_value = format(number & 0xFFFF, "04X")
+
+    return bytes(hex_value, "ascii")
+
+
+def _scale_laser_value(value: str) -> bytes:
+    try:
+        percent = int(value)
+    except ValueError as exc:
+        raise ValueError("Value must be an int") from exc
+
+    if percent > 100:
+        raise ValueError("Value must be between 0 and 100")
+
+    if percent >= 0:
+        return _LASER_ENCODE[percent]
+
+    scaled = 109 + math.floor(1.1 * percent + 0.5)
+    # Convert to hex string with 4 characters
+    return _decimal_to_signed_hex(scaled)
+
+
+def _unscale_laser_value(raw: int) -> int:
+    # jvc returns a weird scale
+    percent = _LASER_DECODE.get(raw)
+    if percent is None:
+        return math.floor(((raw - 109) / 1.1) + 0.5)
+    return percent
+
+
+# laser percent 0-100 <-> the projector's 109-219 scale, both ways are tiny tables
+_LASER_ENCODE = tuple(
+    _decimal_to_signed_hex(109 + math.floor(1.1 * percent + 0.5))
+    for percent in range(101)
+)
+_LASER_DECODE = {raw: math.floor(((raw - 109) / 1.1) + 0.5) for raw in range(109, 220)}
+
+
+def _response_payload(response: bytes) -> bytes:
+    """
+    Slice the payload out of a reference response, dropping the headers and ack
+    """
+    return response[_RESPONSE_PAYLOAD]
+
+
+def _password_to_sha256(password: str) -> str:
+    """
+    Convert a password to sha256 for new models
+    """
+    val = f"{password}JVCKWPJ"
+    return hashlib.sha256(val.encode()).hexdigest()
+
+
+def _build_pj_req(password: str, new_model: bool) -> bytes:
+    """
+    Build the PJREQ sent during the handshake, with the password if set
+    """
+    if not password:
+        return PJ_REQ
+
+    # new models require a sha256 encoded password
+    if new_model:
+        password = _password_to_sha256(password)
+
+    return PJ_REQ + f"_{password}".encode()
+
+
+def _decode_state(command: str, state: bytes) -> Union[str, None]:
+    """
+    Turn a reference response into the option name, like b"1" -> on for power
+
+    Returns None for commands that return a raw value instead of an Enum option
+    Raises KeyError if the payload is not one of the options
+    """
+    _, options = _QUERIES[command]
+    if options is None:
+        return None
+    return options[_response_payload(state)]
+
+
+def _check_named_states(commands: list[str]) -> None:
+    """
+    Raise ValueError for attributes that return a raw value, like lamp_time
+
+    Batch reads return option names, read those with their get_* method
+    """
+    raw = [command for command in commands if _QUERIES[command][1] is None]
+    if raw:
+        raise ValueError(f"{raw} have no named states, use their get_* methods")
+
+
+@functools.lru_cache(maxsize=256)
+def _build_command(raw_command: str, command_type: bytes) -> tuple[bytes, ACKs]:
+    """
+    Transform commands into their byte values from the string value
+
+    The result only depends on the arguments so it is cached, repeated
+    commands like "power,on" skip the parsing and Enum lookups
+    """
+    # split command into the base and the action like menu: left
+    try:
+        command, value = raw_command.split(",")
+    except ValueError:
+        return "No value for command provided", False
+
+    # construct the command from the flattened Enums
+    try:
+        command_name, options, ack = _COMMAND_MAP[command]
+    except KeyError as err:
+        raise NotImplementedError(f"Command {command} not implemented") from err
+
+    if command == "laser_value":
+        value = _scale_laser_value(value)
+
+    # some commands use int values so we can just pass the value as byte
+    if options is None:
+        try:
+            command_base: bytes = command_name + value
+        except ValueError as err:
+            raise jvc_projector.errors.ValueIsNotIntError(
+                f"Value {value} is not an int"
+            ) from err
+    else:
+        try:
+            command_base: bytes = command_name + options[value.lstrip(" ")]
+        except KeyError as err:
+            raise NotImplementedError(f"Value {value} not in Enum") from err
+    # Construct command based on required values
+    command: bytes = b"".join((command_type, _PJ_UNIT, command_base, _FOOTER))
+
+    return command, ack
+
 
 class JVCProjector:
-    """JVC Projector Control"""
+    """
+    JVC Projector Control
+
+    A read timeout drops the connection and the next command reconnects,
+    a late reply can't be told apart from the next command's reply
+    """
+
+    _PJ_OK_LEN = len(PJ_OK)
+    _PJ_ACK_LEN = len(PJ_ACK)
 
     def __init__(
         self,
         host: str,
         password: str = "",
         # Can supply a logger object. It can hook into the HA logger
-        logger: logging.Logger = logging.getLogger(__name__),
+        logger: Union[logging.Logger, None] = None,
         port: int = 20554,
         connect_timeout: int = 3,
         # 2024+ models require a sha256 encoded password
         new_model: bool = False,
+        # seconds to reuse a queried state for, 0 always asks the projector
+        cache_ttl: float = 0,
     ):
         self.host = host
         self.port = port
@@ -44,13 +323,31 @@ class JVCProjector:
         self.password = password
         self.new_model = new_model
         self.connect_timeout: int = connect_timeout
-        self.logger = logger
+        self.logger = logger or _LOG
         self.client = None
         # NZ or NX (NP5 is classified as NX)
         self.model_family = ""
         self.lock = threading.Lock()
-
-        socket.setdefaulttimeout(3)
+        self.cache_ttl = cache_ttl
+        # command name -> (monotonic time, response), cleared by any operation
+        self._state_cache: dict[str, tuple[float, bytes]] = {}
+        # (monotonic time, name) of the last power state read
+        self._last_power_state: tuple[float, str] = (0.0, "")
+        # bumped by every operation, a read that raced one is not cached
+        self._cache_generation = 0
+        # set after a stray frame was seen, the rest of it may still arrive
+        self._stale = False
+        # backoff state so an unreachable projector fails fast between attempts
+        self._reconnect_delay = 0.0
+        self._reconnect_at = 0.0
+        # the PJREQ (and password hash) is the same for every handshake
+        self._pj_req = self._build_pj_req()
+        # reusable receive buffer for the fixed-size handshake and ack reads
+        self._rx_buf = bytearray(64)
+        self._rx_view = memoryview(self._rx_buf)
+        # reference responses are read into their own buffer
+        self._msg_buf = bytearray(1024)
+        self._msg_view = memoryview(self._msg_buf)
 
     def open_connection(self) -> bool:
         """Open a connection"""
@@ -64,10 +361,12 @@ class JVCProjector:
         """Initiate keep-alive connection. This should handle any error and reconnect eventually."""
         try:
             self.logger.info("Connecting to JVC Projector: %s:%s", self.host, self.port)
-            self.client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.client.settimeout(self.connect_timeout)
+            self._stale = False
+            # resolves the host and tries each address, so IPv6 works too
             try:
-                self.client.connect((self.host, self.port))
+                self.client = socket.create_connection(
+                    (self.host, self.port), timeout=self.connect_timeout
+                )
             except TypeError as err:
                 self.logger.error("TypeError when connecting")
                 raise TypeError(
@@ -77,6 +376,9 @@ class JVCProjector:
                 self.logger.error("Connection failed")
                 raise ConnectionError from err
 
+            # commands are tiny request/response frames, don't let Nagle hold them back
+            self.client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._enable_keepalive()
             self.logger.info("Connected to JVC Projector")
 
             # create a reader and writer to do handshake
@@ -89,85 +391,221 @@ class JVCProjector:
             self.logger.warning("Connection timed out")
         except OSError as err:
             self.logger.warning("Connecting failed")
-            self.logger.debug(err)
+            self.logger.debug("%s", err)
 
         return False
 
-    def _password_to_sha256(self, password: str) -> str:
+    def _enable_keepalive(self) -> None:
         """
-        Convert a password to sha256 for new models
+        Turn on TCP keepalive so a projector that vanished (unplugged, power cut)
+        is noticed within about 40 seconds instead of the 2 hour OS default
         """
-        val = f"{password}JVCKWPJ"
-        return hashlib.sha256(val.encode()).hexdigest()
+        self.client.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        # linux and macOS 10.15+: idle 30s, then drop if a probe goes
+        # unanswered for 10s
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            self.client.setsockopt(
+                socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, _KEEPALIVE_IDLE
+            )
+            self.client.setsockopt(
+                socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, _KEEPALIVE_INTERVAL
+            )
+            self.client.setsockopt(
+                socket.IPPROTO_TCP, socket.TCP_KEEPCNT, _KEEPALIVE_COUNT
+            )
+        # windows only takes idle and interval, in ms. It always sends 10
+        # probes, so detection takes about 130s there
+        elif hasattr(socket, "SIO_KEEPALIVE_VALS"):
+            self.client.ioctl(
+                socket.SIO_KEEPALIVE_VALS,
+                (1, _KEEPALIVE_IDLE * 1000, _KEEPALIVE_INTERVAL * 1000),
+            )
+        # linux: a command sent to a vanished projector fails with ETIMEDOUT
+        # after a few seconds instead of retransmitting for ~15 minutes. This
+        # also caps keepalive, see _KEEPALIVE_COUNT
+        if hasattr(socket, "TCP_USER_TIMEOUT"):
+            self.client.setsockopt(
+                socket.IPPROTO_TCP, socket.TCP_USER_TIMEOUT, _USER_TIMEOUT * 1000
+            )
 
-    def _handshake(self) -> bool:
-        """
-        Do the 3 way handshake
+    def _password_to_sha256(self, password: str) -> str:
+        return _password_to_sha256(password)
 
-        Projector sends PJ_OK, client sends PJREQ (with optional password) within 5 seconds, projector replies with PJACK
-        first, after connecting, see if we receive PJ_OK. If not, raise exception
+    def _build_pj_req(self) -> bytes:
+        """
+        Build the PJREQ sent during the handshake, with the password if set
         """
         if self.password:
-            # new models require a sha256 encoded password
-            val = self.password
             if self.new_model:
-                val = self._password_to_sha256(val)
                 self.logger.debug("using sha256 password")
-            pj_req = PJ_REQ + f"_{val}".encode()
             self.logger.debug("connecting with password")
+
+        return _build_pj_req(self.password, self.new_model)
+
+    def _recv_exactly(self, size: int) -> bytes:
+        """
+        Read exactly size bytes, recv() can return a partial TCP segment
+
+        The whole read is bounded by connect_timeout, not each recv(), so a
+        projector trickling bytes can't hold the lock forever
+
+        Raises ConnectionClosedError if the projector closes the socket mid-read
+        Raises TimeoutError if size bytes don't arrive in time
+        """
+        if size <= len(self._rx_buf):
+            view = self._rx_view[:size]
         else:
-            pj_req = PJ_REQ
+            view = memoryview(bytearray(size))
+        got = self.client.recv_into(view)
+        if got == size:
+            return bytes(view)
+        if not got:
+            raise jvc_projector.errors.ConnectionClosedError(
+                f"Connection closed after 0 of {size} bytes"
+            )
 
-        # 3 step handshake
-        with self.lock:
-            msg_pjok = self.client.recv(1000)
-            if msg_pjok != PJ_OK:
-                result = (
-                    f"Projector did not reply with correct PJ_OK greeting: {msg_pjok}"
-                )
-                self.logger.error(result)
-                return False
+        # short read, wait for the rest within the same overall budget
+        deadline = time.monotonic() + self.connect_timeout
+        try:
+            while got < size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f"Got {got} of {size} bytes: {bytes(view[:got])}"
+                    )
+                self.client.settimeout(remaining)
+                chunk_len = self.client.recv_into(view[got:])
+                if not chunk_len:
+                    raise jvc_projector.errors.ConnectionClosedError(
+                        f"Connection closed after {got} of {size} bytes: "
+                        f"{bytes(view[:got])}"
+                    )
+                got += chunk_len
+        finally:
+            self.client.settimeout(self.connect_timeout)
 
-            # try sending PJREQ, if there's an error, raise exception
-            self.client.sendall(pj_req)
+        return bytes(view)
 
-            # see if we receive PJACK, if not, raise exception
-            msg_pjack = self.client.recv(1000)
-            if msg_pjack != PJ_ACK:
-                result = f"Exception with PJACK: {msg_pjack}"
-                self.logger.error(result)
-                return False
-            self.logger.debug("Handshake successful")
+    def _recv_reference(self, ack_value: bytes) -> tuple[bytes, bytes]:
+        """
+        Read the ack and the reference response behind it, usually in one recv
+
+        The projector sends both back to back, so read until the first footer
+        that follows the ack instead of issuing a recv for each. Anything
+        after that footer is not ours, it is dropped and the connection is
+        marked stale. Bounded by connect_timeout like _recv_exactly
+
+        Returns (ack, response)
+        """
+        ack_len = len(ack_value)
+        view = self._msg_view
+        got = 0
+        end = 0
+        deadline = None
+        try:
+            while True:
+                chunk_len = self.client.recv_into(view[got:])
+                if not chunk_len:
+                    raise jvc_projector.errors.ConnectionClosedError(
+                        f"Connection closed after {got} bytes: {bytes(view[:got])}"
+                    )
+                got += chunk_len
+                # a wrong ack won't be followed by a response, stop early
+                head = min(got, ack_len)
+                if view[:head] != ack_value[:head]:
+                    end = got
+                    break
+                end = self._msg_buf.find(_FOOTER, ack_len, got) + 1
+                if end:
+                    break
+
+                # partial read, wait for the rest within one overall budget
+                if deadline is None:
+                    deadline = time.monotonic() + self.connect_timeout
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or got == len(view):
+                    raise TimeoutError(
+                        f"Got {got} bytes of response: {bytes(view[:got])}"
+                    )
+                self.client.settimeout(remaining)
+        finally:
+            if deadline is not None:
+                self.client.settimeout(self.connect_timeout)
+
+        if end < got:
+            # another frame came in right behind this one
+            self._stale = True
+        return bytes(view[:ack_len]), bytes(view[ack_len:end])
+
+    def _handshake(self) -> bool:
+        """
+        Do the 3 way handshake
+
+        Projector sends PJ_OK, client sends PJREQ (with optional password) within 5 seconds, projector replies with PJACK
+        first, after connecting, see if we receive PJ_OK. If not, raise exception
+        """
+        # 3 step handshake
+        # no lock needed, this is a brand new socket nobody else can see yet.
+        # reconnect() can also run under self.lock from _do_command
+        try:
+            msg_pjok = self._recv_exactly(self._PJ_OK_LEN)
+        except jvc_projector.errors.ConnectionClosedError as err:
+            self.logger.error("Connection closed during PJ_OK greeting: %s", err)
+            return False
+        if msg_pjok != PJ_OK:
+            result = f"Projector did not reply with correct PJ_OK greeting: {msg_pjok}"
+            self.logger.error(result)
+            return False
+
+        # try sending PJREQ, if there's an error, raise exception
+        self.client.sendall(self._pj_req)
+
+        # see if we receive PJACK, if not, raise exception
+        try:
+            msg_pjack = self._recv_exactly(self._PJ_ACK_LEN)
+        except jvc_projector.errors.ConnectionClosedError as err:
+            self.logger.error("Connection closed during PJACK: %s", err)
+            return False
+        if msg_pjack != PJ_ACK:
+            result = f"Exception with PJACK: {msg_pjack}"
+            self.logger.error(result)
+            return False
+        self.logger.debug("Handshake successful")
 
         # Get model family
-        self.model_family = self._get_modelfamily()
-        self.logger.debug("Model code is %s", self.model_family)
+        # the model does not change for the lifetime of the object, only ask once
+        if not self.model_family:
+            self.model_family = self._get_modelfamily()
+            self.logger.debug("Model code is %s", self.model_family)
+            # the connection dropped during the lookup and was closed
+            if self.client is None:
+                return False
         return True
 
     def _get_modelfamily(self) -> str:
         self.logger.debug("Getting model family")
-        cmd = (
-            Header.reference.value
-            + Header.pj_unit.value
-            + Commands.get_model.value
-            + Footer.close.value
-        )
-
-        res, _ = self._send_command(
-            cmd,
-            command_type=Header.reference.value,
+        # straight to _do_command, the caller may already hold self.lock
+        res, success = self._do_command(
+            _MODEL_REQUEST,
             ack=ACKs.model.value,
+            command_type=_HDR_REF,
         )
-        model_res = self._replace_headers(res).decode()
-        self.logger.debug(model_res)
+        # leave it unset so the next handshake asks again
+        if not success:
+            return ""
+        self.logger.debug("Model response: %s", res)
 
-        # get last 4 char of response and look up value
-        return model_map.get(model_res[-4:], "Unsupported")
+        # the model code is the last 4 bytes before the footer
+        return _MODEL_BY_CODE.get(res[-5:-1], "Unsupported")
 
     def is_closed(self) -> bool:
         """Return False if the socket is open, True if it is closed."""
+        if self.client is None:
+            return True
+        debug = self.logger.isEnabledFor(logging.DEBUG)
         try:
-            self.logger.debug("Checking if socket is closed")
+            if debug:
+                self.logger.debug("Checking if socket is closed")
             # send null command
             self.client.sendall(b"\x00\x00")
         except BlockingIOError:
@@ -184,20 +622,23 @@ class JVCProjector:
             self.logger.warning("OSError: Socket not connected: %s", e)
             return True  # Treat any other OSError as a closed connection
 
-        self.logger.debug(
-            "Socket is open, no exceptions were raised, and data is present."
-        )
+        if debug:
+            self.logger.debug(
+                "Socket is open, no exceptions were raised, and data is present."
+            )
         return False  # If no exceptions and data is present, the socket is open
 
     def close_connection(self):
         """
         close the connection
         """
-        self.client.close()
+        if self.client is not None:
+            self.client.close()
+            self.client = None
 
     def _send_command(
         self,
-        send_command: Union[list[str], str],
+        send_command: Union[list[str], bytes],
         command_type: bytes = b"!",
         ack: bytes = None,
     ) -> tuple[str, bool]:
@@ -207,13 +648,15 @@ class JVCProjector:
         The PJ API returns nothing if a command is in flight
         or if a command is not successful
 
-        send_command: Can be a command or a list of commands
-        ack: value of the ack we expect, like PW
+        send_command: Can be a prebuilt frame or a list of commands
+        ack: value of the ack we expect for a prebuilt frame, like PW
         command_type: which operation, like ! or ?
 
+        A list is sent in order and stops at the first failing command
+
         Returns:
             (
-                ack or error message: str,
+                ack of the last command or error message: str,
                 success flag: bool
             )
         """
@@ -223,36 +666,73 @@ class JVCProjector:
         #     self.reconnect()
 
         # Check commands
-        self.logger.debug("Command_type: %s", command_type)
-        self.logger.debug(
-            "Send command: %s is of type %s", send_command, type(send_command)
-        )
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug("Command_type: %s", command_type)
+            self.logger.debug(
+                "Send command: %s is of type %s", send_command, type(send_command)
+            )
 
+        # check emulate remote first, it takes the lock itself
+        if isinstance(send_command, list) and "remote" in send_command[0]:
+            try:
+                _, value = send_command[0].split(",")
+            except ValueError:
+                return f"No value for command provided {send_command}", False
+            return self.emulate_remote(value)
+
+        if isinstance(send_command, list):
+            # build every frame before taking the lock, parsing needs no socket
+            # and a bad entry fails before anything is sent
+            frames = []
+            for cmd in send_command:
+                cons_command, ack = self._construct_command(cmd, command_type)
+                if not ack:
+                    self.logger.warning(
+                        "Command not implemented: %s - %s", cmd, cons_command
+                    )
+                    return cons_command, ack
+                frames.append((cons_command, ack.value))
+        elif not isinstance(send_command, bytes):
+            return ("unsupported commands", False)
+
+        # hold the lock across the write and every read of the reply, acks don't
+        # say which command they belong to
         with self.lock:
-            self.logger.debug("Send ack: %s", ack)
-            if command_type == Header.reference.value:
-                return self._do_command(send_command, ack, command_type)
-
-            if isinstance(send_command, list):
-                # check emulate remote first
-                if "remote" in send_command[0]:
-                    try:
-                        _, value = send_command[0].split(",")
-                        return self.emulate_remote(value)
-                    except ValueError:
-                        return f"No value for command provided {send_command}", False
-
-                for cmd in send_command:
-                    cons_command, ack = self._construct_command(cmd, command_type)
-                    if not ack:
-                        self.logger.warning(
-                            "Command not implemented: %s - %s", cmd, cons_command
-                        )
-                        return cons_command, ack
-                    return self._do_command(cons_command, ack.value, command_type)
-
-            else:
-                return ("unsupported commands", False)
+            # an operation can change any cached state, e.g. picture mode -> LL
+            if command_type == _HDR_OP:
+                self._state_cache.clear()
+                self._last_power_state = (0.0, "")
+                self._cache_generation += 1
+
+            # frames built by the caller (reference ops, info) go straight out
+            if isinstance(send_command, bytes):
+                if debug:
+                    self.logger.debug("Send ack: %s", ack)
+                result = self._do_command(send_command, ack, command_type)
+                # the connection dropped under us, a reference is safe to repeat
+                # so retry it once on a fresh connection. Operations are not
+                # retried, the projector may already have acted on them, and
+                # neither is a timeout, the projector is busy or off
+                if (
+                    not result[1]
+                    and result[0] != _TIMED_OUT
+                    and command_type == _HDR_REF
+                    and self.client is None
+                    and time.monotonic() >= self._reconnect_at
+                ):
+                    self.logger.warning("Retrying reference command on new connection")
+                    result = self._do_command(send_command, ack, command_type)
+                return result
+
+            # run the whole batch under this one lock acquisition
+            result = None
+            for cons_command, ack_value in frames:
+                result = self._do_command(cons_command, ack_value, command_type)
+                if not result[1]:
+                    return result
+
+            return result
 
     def _do_command(
         self,
@@ -261,32 +741,47 @@ class JVCProjector:
         command_type: bytes = b"!",
     ) -> tuple[Union[str, bytes], bool]:
 
-        # ensure this doesnt run with dead client
-        if self.is_closed():
-            self.logger.warning("reconnecting")
-            self.reconnect()
+        # skip the logging calls entirely on the normal, non-debug path
+        debug = self.logger.isEnabledFor(logging.DEBUG)
 
-        # retry once in case connection is dead
-        self.logger.debug("do_command sending command: %s", command)
+        if debug:
+            self.logger.debug("do_command sending command: %s", command)
         # send the command
         try:
-            self.client.sendall(command)
+            # ensure this doesnt run with dead client
+            self._ensure_connected()
+            if self._stale:
+                self._drain()
+            # no liveness probe up front, a dead socket shows up as a failed send
+            try:
+                self.client.sendall(command)
+            except ConnectionError as err:
+                # the frame never went out, so it is safe to send it again
+                self.logger.warning("Send failed, reconnecting: %s", err)
+                self.close_connection()
+                self._ensure_connected()
+                self.client.sendall(command)
 
             # if we send a command that returns info, the projector will send
             # an ack, followed by the actual message. Check to see if the ack sent by
             # projector is correct, then return the message.
-            ack_value = (
-                Header.ack.value + Header.pj_unit.value + ack + Footer.close.value
-            )
-            self.logger.debug("constructed ack_value: %s", ack_value)
+            ack_value = _ACK_VALUES.get(ack) or _ACK_PREFIX + ack + _FOOTER
+            if debug:
+                self.logger.debug("constructed ack_value: %s", ack_value)
 
             # Receive the acknowledgement from PJ
 
             # most commands timeout when PJ is off
-            received_msg = self.client.recv(len(ack_value))
-            self.logger.debug("received msg from PJ: %s", received_msg)
+            if command_type == _HDR_REF:
+                received_msg, payload = self._recv_reference(ack_value)
+            else:
+                received_msg, payload = self._recv_exactly(len(ack_value)), b""
+            if debug:
+                self.logger.debug("received msg from PJ: %s %s", received_msg, payload)
 
-            msg = self._check_received_msg(received_msg, ack_value, command_type)
+            msg = self._check_received_msg(
+                received_msg, ack_value, command_type, payload
+            )
             if msg == b"":
                 self.logger.error("Got a blank msg")
 
@@ -294,65 +789,111 @@ class JVCProjector:
             return msg, True
 
         except TimeoutError as err:
+            # the reply may still arrive at any point and acks don't say which
+            # command they belong to, e.g. every PM* query acks PM. Start over
+            # on a new connection so it can't be read as the next reply
             self.logger.error("TimeoutError when getting msg %s", err)
+            self.close_connection()
+            return _TIMED_OUT, False
 
-        except ConnectionRefusedError as err:
-            self.logger.error("ConnectionRefusedError when getting msg %s", err)
+        except (jvc_projector.errors.ConnectionClosedError, ConnectionError) as err:
+            # the socket is dead, drop it so the next command reconnects
+            self.logger.error("Connection lost when getting msg %s", err)
+            self.close_connection()
+            return "Connection lost", False
 
         except OSError as err:
             self.logger.error("OSError when getting msg %s", err)
+            # anything but a transient error leaves the socket unusable
+            if err.errno not in _TRANSIENT_ERRNOS:
+                self.close_connection()
+            return f"OSError when getting msg {err}", False
+
+    def _ensure_connected(self) -> None:
+        """
+        Reuse the open connection, only reconnecting when it was dropped
+
+        Raises ConnectionError while backing off after a failed reconnect,
+        instead of blocking every command on another connect timeout
+        """
+        if self.client is not None:
+            return
+
+        now = time.monotonic()
+        if now < self._reconnect_at:
+            raise ConnectionError(
+                f"Projector unreachable, retrying in {self._reconnect_at - now:.1f}s"
+            )
+
+        self.logger.warning("reconnecting")
+        if self.reconnect():
+            self._reconnect_delay = 0.0
+            return
+
+        self._reconnect_delay = min(
+            _RECONNECT_MAX_DELAY, max(_RECONNECT_MIN_DELAY, self._reconnect_delay * 2)
+        )
+        # jitter so several clients don't retry in lockstep
+        self._reconnect_at = (
+            time.monotonic() + self._reconnect_delay + random.uniform(0, 0.25)
+        )
+        self.close_connection()
+        raise ConnectionError("Reconnect failed")
+
+    def _drain(self) -> None:
+        """
+        Discard the rest of a stray frame after a wrong ack or an extra frame
+
+        Otherwise it would be read as the ack of the next command. Waits up
+        to _DRAIN_GRACE for the first bytes, a response sent right behind a
+        stray ack may not have arrived yet
+        """
+        timeout = _DRAIN_GRACE
+        while select.select([self.client], [], [], timeout)[0]:
+            if not self.client.recv_into(self._msg_view):
+                raise jvc_projector.errors.ConnectionClosedError(
+                    "Connection closed while draining"
+                )
+            timeout = 0
+        self._stale = False
 
     def _check_received_msg(
-        self, received_msg: bytes, ack_value: bytes, command_type: bytes
+        self,
+        received_msg: bytes,
+        ack_value: bytes,
+        command_type: bytes,
+        payload: bytes = b"",
     ) -> bytes:
         # This is unlikely to happen unless we read blank response
         if received_msg == b"":
             return received_msg
 
         # get the ack for operation
-        if received_msg == ack_value and command_type == Header.operation.value:
+        if received_msg == ack_value and command_type == _HDR_OP:
             return received_msg
 
         # if we got what we expect and this is a reference,
-        # receive the data we requested
-        if received_msg == ack_value and command_type == Header.reference.value:
-            message = self.client.recv(1000)
-            self.logger.debug("received message from PJ: %s", message)
-
-            return message
+        # return the data we requested
+        if received_msg == ack_value and command_type == _HDR_REF:
+            return payload
 
         self.logger.error(
             "Received ack: %s != expected ack: %s",
             received_msg,
             ack_value,
         )
+        # the rest of the stray frame may still be queued, drain it before
+        # the next command so it isn't read as that command's ack
+        self._stale = True
 
         # return blank will force it to retry
         return b""
 
     def _decimal_to_signed_hex(self, number: int) -> bytes:
-        # Convert input string to integer
-
-        # Convert the decimal value to signed 2-byte hexadecimal
-        hex_value = format(number & 0xFFFF, "04X")
-
-        byte_values = bytes(hex_value, "ascii")
-
-        return byte_values
+        return _decimal_to_signed_hex(number)
 
     def _scale_laser_value(self, value: str) -> bytes:
-        try:
-            percent = int(value)
-        except ValueError as exc:
-            raise ValueError("Value must be an int") from exc
-
-        if percent > 100:
-            return ValueError("Value must be between 0 and 100")
-
-        scaled = 109 + math.floor(1.1 * percent + 0.5)
-        return self._decimal_to_signed_hex(
-            scaled
-        )  # Convert to hex string with 4 characters
+        return _scale_laser_value(value)
 
     def _construct_command(
         self, raw_command: str, command_type: bytes
@@ -360,45 +901,13 @@ class JVCProjector:
         """
         Transform commands into their byte values from the string value
         """
-        # split command into the base and the action like menu: left
         try:
-            command, value = raw_command.split(",")
-        except ValueError:
-            return "No value for command provided", False
-
-        # Check if command is implemented
-        if not hasattr(Commands, command):
-            self.logger.error("Command not implemented: %s", command)
-            raise NotImplementedError(f"Command {command} not implemented")
-
-        # construct the command with nested Enums
-        command_name, val, ack = Commands[command].value
-
-        if command == "laser_value":
-            value = self._scale_laser_value(value)
-
-        self.logger.debug("val is %s", val)
-        self.logger.debug("type of val is %s", type(val))
-        self.logger.debug("value is %s", value)
-
-        # some commands use int values so we can just pass the value as byte
-        if issubclass(val, int):
-            try:
-                command_base: bytes = command_name + value
-            except ValueError as err:
-                self.logger.error("Value %s is not an int", value)
-                raise jvc_projector.errors.ValueIsNotIntError from err
-        else:
-            try:
-                command_base: bytes = command_name + val[value.lstrip(" ")].value
-            except KeyError as err:
-                self.logger.error("Value %s is not in Enum", value)
-                raise NotImplementedError(f"Value {value} not in Enum") from err
-        # Construct command based on required values
-        command: bytes = (
-            command_type + Header.pj_unit.value + command_base + Footer.close.value
-        )
-        self.logger.debug("command: %s", command)
+            command, ack = _build_command(raw_command, command_type)
+        except (NotImplementedError, jvc_projector.errors.ValueIsNotIntError) as err:
+            self.logger.error("Could not construct %s: %s", raw_command, err)
+            raise
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("command: %s", command)
 
         return command, ack
 
@@ -426,17 +935,10 @@ class JVCProjector:
         """
         Bring up the Info screen
         """
-        cmd = (
-            Header.operation.value
-            + Header.pj_unit.value
-            + Commands.info.value
-            + Footer.close.value
-        )
-
         return self._send_command(
-            cmd,
-            ack=ACKs.menu_ack,
-            command_type=Header.operation.value,
+            _INFO_REQUEST,
+            ack=ACKs.menu_ack.value,
+            command_type=_HDR_OP,
         )
 
     def emulate_remote(self, remote_code: str) -> tuple[str, bool]:
@@ -445,18 +947,20 @@ class JVCProjector:
 
         remote_code: str- ASCII of the remote code like 23 or D4 https://support.jvc.com/consumer/support/documents/DILAremoteControlGuide.pdf
         """
-        cmd = (
-            Header.operation.value
-            + Header.pj_unit.value
-            + Commands.remote.value
-            + remote_code.encode()
-            + Footer.close.value
+        cmd = b"".join(
+            (
+                _HDR_OP,
+                _PJ_UNIT,
+                Commands.remote.value,
+                remote_code.encode(),
+                _FOOTER,
+            )
         )
 
-        return self._do_command(
+        return self._send_command(
             cmd,
             ack=ACKs.menu_ack.value,
-            command_type=Header.operation.value,
+            command_type=_HDR_OP,
         )
 
     def power_on(
@@ -473,66 +977,135 @@ class JVCProjector:
         """
         return self.exec_command(["power,off"])
 
-    def _replace_headers(self, item: bytes) -> bytes:
+    def _cached_state(self, command: str) -> bytes:
         """
-        Will strip all headers and returns the value itself
+        Return the response cached within cache_ttl, or b"" if there is none
         """
-        headers = [x.value for x in Header] + [x.value for x in Footer]
-        for header in headers:
-            item = item.replace(header, b"")
-
-        return item
+        if self.cache_ttl:
+            cached = self._state_cache.get(command)
+            if cached and time.monotonic() - cached[0] < self.cache_ttl:
+                return cached[1]
+        return b""
 
-    def _do_reference_op(self, command: str, ack: ACKs) -> str:
-        cmd = (
-            Header.reference.value
-            + Header.pj_unit.value
-            + Commands[command].value[0]
-            + Footer.close.value
-        )
+    def _cache_state(self, command: str, state: bytes) -> None:
+        """
+        Remember a successful response when caching is enabled
+        """
+        if self.cache_ttl and state:
+            self._state_cache[command] = (time.monotonic(), state)
 
-        msg, _ = self._send_command(
-            cmd,
-            ack=ACKs[ack.name].value,
-            command_type=Header.reference.value,
+    def _do_reference_op(self, command: str, ack: ACKs) -> bytes:
+        msg, success = self._send_command(
+            _REF_COMMANDS[command],
+            ack=ack.value,
+            command_type=_HDR_REF,
         )
 
-        return msg
+        # the error message is not a response, callers treat blank as failed
+        return msg if success else b""
 
     def _get_attribute(self, command: str, replace: bool = True) -> str:
         """
         Generic function to get the current attribute asynchronously
         """
-        cmd_tup = Commands[command].value
-        self.logger.debug("Getting attribute %s with tuple %s", command, cmd_tup)
-        cmd_enum = cmd_tup[1]
-        ack = cmd_tup[2]
-        self.logger.debug("Getting attribute %s with tuple %s", command, cmd_tup)
-        try:
-            try:
-                state = self._do_reference_op(command, ack)
-            except TypeError:
-                return ""
+        ack, _ = _QUERIES[command]
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Getting attribute %s", command)
+        if command in _NEEDS_POWER and self._is_powered_down():
+            self.logger.debug("%s skipped, projector is off", command)
+            return ""
+        # back to back polls of the same attribute reuse the last response
+        state = self._cached_state(command)
+        if not state:
+            generation = self._cache_generation
+            state = self._do_reference_op(command, ack)
             if not state:
                 self.logger.debug("%s Command failed", command)
                 return ""
-            if replace:
-                # remove the returned headers
-                r = self._replace_headers(state)
-                if not isinstance(r, bytes):
-                    self.logger.error("Attribute %s is not bytes", command)
-                    return ""
-                self.logger.debug("Attribute %s is %s", command, r)
-                # look up the enum value like b"1" -> on in PowerModes
-                return cmd_enum(r.replace(ack.value, b"")).name
-
-            return state
-        except ValueError as err:
-            self.logger.error("Attribute not found - %s", err)
-            raise
-        except AttributeError as err:
-            self.logger.error("tried to access name on non-enum: %s", err)
+            # the lock was released after the read, an operation since then
+            # may have changed the state and cleared the cache
+            if generation == self._cache_generation:
+                self._cache_state(command, state)
+        if replace:
+            return self._decode_attribute(command, state)
+
+        return state
+
+    def _is_powered_down(self) -> bool:
+        """
+        True if the projector was in standby or cooling a moment ago
+        """
+        checked_at, state = self._last_power_state
+        return (
+            state in _POWERED_DOWN
+            and time.monotonic() - checked_at < _POWER_STATE_MAX_AGE
+        )
+
+    def _decode_attribute(self, command: str, state: bytes) -> str:
+        """
+        Turn a reference response into the option name, like b"1" -> on for power
+        """
+        # remove the returned headers and ack
+        r = _response_payload(state)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Attribute %s is %s", command, r)
+        try:
+            name = _decode_state(command, state)
+        except KeyError as err:
+            self.logger.error("Attribute not found - %s", r)
+            raise ValueError(f"{r} is not a valid {command} value") from err
+        if name is None:
+            self.logger.error("tried to access name on non-enum: %s", command)
             return ""
+        return name
+
+    def get_all_state(self, commands: list[str]) -> dict[str, str]:
+        """
+        Query several attributes in one go, like calling each get_* in turn
+
+        The queries run back to back under a single lock acquisition so other
+        callers can't interleave. Each one is still acked before the next is
+        sent, the projector drops commands that arrive while it is busy.
+        Cached states are reused and attributes that need power are skipped
+        while the projector is off, the same as the get_* methods
+
+        commands: attribute names like ["power", "low_latency", "picture_mode"]
+
+        Returns a dict of attribute name -> state, "" for a query that failed
+        Raises ValueError for attributes with a raw value, like lamp_time
+        """
+        _check_named_states(commands)
+        responses = {}
+        with self.lock:
+            for command in commands:
+                if command in _NEEDS_POWER and self._is_powered_down():
+                    responses[command] = b""
+                    continue
+                state = self._cached_state(command)
+                if not state:
+                    ack, _ = _QUERIES[command]
+                    msg, success = self._do_command(
+                        _REF_COMMANDS[command], ack.value, _HDR_REF
+                    )
+                    state = msg if success else b""
+                    self._cache_state(command, state)
+                responses[command] = state
+                # same bookkeeping as _get_power_state, so later keys can skip
+                if command == "power" and state:
+                    power_state = _POWER_STATE_BY_BYTES.get(_response_payload(state))
+                    if power_state:
+                        self._last_power_state = (time.monotonic(), power_state)
+
+        states = {}
+        for command, state in responses.items():
+            try:
+                states[command] = (
+                    self._decode_attribute(command, state) if state else ""
+                )
+            except ValueError:
+                states[command] = ""
+
+        return states
 
     def get_low_latency_state(self) -> str:
         """
@@ -598,8 +1171,7 @@ class JVCProjector:
         # returns something like 0210PJ as bytes
         # b'@\x89\x01IF0300PJ\n'
         ver: str = (
-            self._replace_headers(state)
-            .replace(ACKs.info_ack.value, b"")
+            _response_payload(state)
             .replace(b"PJ", b"")
             .decode()
             # remove leading 0
@@ -609,18 +1181,17 @@ class JVCProjector:
         return float(f"{ver[:1]}.{ver[1:]}")
 
     def _translate_laser_value(self, state: str) -> int:
-        raw = int(
-            self._replace_headers(state).replace(ACKs.picture_ack.value, b""),
-            16,
-        )
-        # jvc returns a weird scale
-        return math.floor(((raw - 109) / 1.1) + 0.5)
+        return _unscale_laser_value(int(_response_payload(state), 16))
 
     def get_laser_value(self) -> int:
         """
         Get the current software version FW 3.0+ only
+
+        Returns -1 if the projector is off or did not answer
         """
         state = self._get_attribute("laser_value", replace=False)
+        if not state:
+            return -1
 
         return self._translate_laser_value(state)
 
@@ -665,7 +1236,7 @@ class JVCProjector:
         Get the current lamp time
         """
         state = self._get_attribute("lamp_time", replace=False)
-        return int(self._replace_headers(state).replace(ACKs.info_ack.value, b""), 16)
+        return int(_response_payload(state), 16)
 
     def get_laser_power(self) -> str:
         """
@@ -712,51 +1283,329 @@ class JVCProjector:
 
         Returns str: values of PowerStates
         """
-        # remove the headers
-        return self._get_attribute("power")
+        generation = self._cache_generation
+        state = self._get_attribute("power", replace=False)
+        if not state:
+            return ""
+        payload = _response_payload(state)
+        try:
+            power_state = _POWER_STATE_BY_BYTES[payload]
+        except KeyError as err:
+            self.logger.error("Attribute not found - %s", payload)
+            raise ValueError(f"{payload} is not a valid power state") from err
+        # don't undo the reset done by an operation like power_on
+        if generation == self._cache_generation:
+            self._last_power_state = (time.monotonic(), power_state)
+        return power_state
 
     def is_on(self) -> bool:
         """
         True if the current state is on|reserved
         """
-        pw_status = [PowerStates.on.name]
-        return self._get_power_state() in pw_status
+        return self._get_power_state() == _POWER_ON_NAME
 
     def is_ll_on(self) -> bool:
         """
         True if LL mode is on
         """
-        return self.get_low_latency_state() == LowLatencyModes.on.name
+        return self.get_low_latency_state() == _LL_ON_NAME
 
     def print_commands(self) -> str:
         """
         Print out all supported commands
         """
-        print_commands = sorted(
-            [
-                command.name
-                for command in Commands
-                if command.name not in ["power", "current_output", "info"]
-            ]
+        # debug only, the listings are built on first use instead of at import
+        from jvc_projector import _debug
+
+        _debug.print_commands()
+
+
+class AsyncJVCProjector:
+    """
+    JVC Projector Control for asyncio callers like Home Assistant
+
+    Takes the same command strings and attribute names as JVCProjector.
+    Attributes are read with get_attribute/get_many/refresh_all, there are no
+    per attribute get_* methods. Commands share one connection and are sent
+    one at a time, each acked before the next. Like JVCProjector, a read
+    timeout drops the connection and the next command reconnects
+    """
+
+    def __init__(
+        self,
+        host: str,
+        password: str = "",
+        logger: Union[logging.Logger, None] = None,
+        port: int = 20554,
+        connect_timeout: int = 3,
+        new_model: bool = False,
+    ):
+        self.host = host
+        self.port = port
+        self.password = password
+        self.new_model = new_model
+        self.connect_timeout: int = connect_timeout
+        self.logger = logger or _LOG
+        self.model_family = ""
+        self._reader: Union[asyncio.StreamReader, None] = None
+        self._writer: Union[asyncio.StreamWriter, None] = None
+        self._lock = asyncio.Lock()
+        self._pj_req = _build_pj_req(password, new_model)
+
+    async def open_connection(self) -> bool:
+        """Open a connection and do the handshake"""
+        self.logger.info("Connecting to JVC Projector: %s:%s", self.host, self.port)
+        try:
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), self.connect_timeout
+            )
+        except (asyncio.TimeoutError, OSError) as err:
+            self.logger.warning("Connecting failed: %s", err)
+            return False
+
+        sock = self._writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        try:
+            if await self._handshake():
+                return True
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, OSError) as err:
+            self.logger.error("Handshake failed: %s", err)
+        await self.close_connection()
+        return False
+
+    async def close_connection(self) -> None:
+        """
+        close the connection
+        """
+        if self._writer is not None:
+            writer = self._writer
+            self._reader = self._writer = None
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    async def _read(self, size: int) -> bytes:
+        return await asyncio.wait_for(
+            self._reader.readexactly(size), self.connect_timeout
         )
-        print("Currently Supported Commands:")
-        for command in print_commands:
-            print(f"\t{command}")
-
-        print("\n")
-        # Print all options
-        print("Currently Supported Parameters:")
-        from jvc_projector import commands
-        import inspect
-
-        for name, obj in inspect.getmembers(commands):
-            if inspect.isclass(obj) and obj not in [
-                Commands,
-                ACKs,
-                Footer,
-                Enum,
-                Header,
-            ]:
-                print(name)
-                for option in obj:
-                    print(f"\t{option.name}")
+
+    async def _handshake(self) -> bool:
+        """
+        Do the 3 way handshake, see JVCProjector._handshake
+        """
+        msg_pjok = await self._read(len(PJ_OK))
+        if msg_pjok != PJ_OK:
+            self.logger.error(
+                "Projector did not reply with correct PJ_OK greeting: %s", msg_pjok
+            )
+            return False
+
+        self._writer.write(self._pj_req)
+        await self._writer.drain()
+
+        msg_pjack = await self._read(len(PJ_ACK))
+        if msg_pjack != PJ_ACK:
+            self.logger.error("Exception with PJACK: %s", msg_pjack)
+            return False
+        self.logger.debug("Handshake successful")
+
+        if not self.model_family:
+            res, success = await self._do_command(
+                _MODEL_REQUEST, ACKs.model.value, _HDR_REF
+            )
+            if success:
+                self.model_family = _MODEL_BY_CODE.get(res[-5:-1], "Unsupported")
+            self.logger.debug("Model code is %s", self.model_family)
+            # the connection dropped during the lookup and was closed
+            if self._writer is None:
+                return False
+        return True
+
+    async def _do_command(
+        self,
+        command: bytes,
+        ack: bytes,
+        command_type: bytes = b"!",
+    ) -> tuple[Union[str, bytes], bool]:
+        """
+        Send one frame and read its ack, plus the response for a reference
+
+        The caller holds self._lock, except during the handshake
+        """
+        if self._writer is None and not await self.open_connection():
+            return "Connection failed", False
+
+        ack_value = _ACK_VALUES.get(ack) or _ACK_PREFIX + ack + _FOOTER
+        try:
+            self._writer.write(command)
+            await self._writer.drain()
+
+            received_msg = await self._read(len(ack_value))
+            if received_msg != ack_value:
+                self.logger.error(
+                    "Received ack: %s != expected ack: %s", received_msg, ack_value
+                )
+                # the rest of the stray frame is still queued, start over
+                await self.close_connection()
+                return "Unexpected ack", False
+            if command_type != _HDR_REF:
+                return received_msg, True
+
+            return (
+                await asyncio.wait_for(
+                    self._reader.readuntil(_FOOTER), self.connect_timeout
+                ),
+                True,
+            )
+
+        except asyncio.TimeoutError:
+            # a late reply would be read as the ack of the next command, start over
+            self.logger.error(_TIMED_OUT)
+            await self.close_connection()
+            return _TIMED_OUT, False
+
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, OSError) as err:
+            self.logger.error("Connection lost when getting msg %s", err)
+            await self.close_connection()
+            return "Connection lost", False
+
+    async def exec_command(
+        self, command: Union[list[str], str], command_type: bytes = b"!"
+    ) -> tuple[str, bool]:
+        """
+        Send one or more commands like "power,on", see JVCProjector.exec_command
+
+        A list is sent in order and stops at the first failing command
+        """
+        if isinstance(command, str):
+            command = [command]
+
+        # remote emulation takes a raw code instead of an Enum option
+        if command and "remote" in command[0]:
+            try:
+                _, value = command[0].split(",")
+            except ValueError:
+                return f"No value for command provided {command}", False
+            return await self.emulate_remote(value.strip())
+
+        frames = []
+        for cmd in command:
+            cons_command, ack = _build_command(cmd, command_type)
+            if not ack:
+                self.logger.warning(
+                    "Command not implemented: %s - %s", cmd, cons_command
+                )
+                return cons_command, ack
+            frames.append((cons_command, ack.value))
+
+        result = ("No command provided", False)
+        async with self._lock:
+            for cons_command, ack_value in frames:
+                result = await self._do_command(cons_command, ack_value, command_type)
+                if not result[1]:
+                    break
+
+        return result
+
+    async def info(self) -> tuple[str, bool]:
+        """
+        Bring up the Info screen
+        """
+        async with self._lock:
+            return await self._do_command(_INFO_REQUEST, ACKs.menu_ack.value, _HDR_OP)
+
+    async def emulate_remote(self, remote_code: str) -> tuple[str, bool]:
+        """
+        Send a cmd via remote emulation, see JVCProjector.emulate_remote
+        """
+        cmd = b"".join(
+            (_HDR_OP, _PJ_UNIT, Commands.remote.value, remote_code.encode(), _FOOTER)
+        )
+        async with self._lock:
+            return await self._do_command(cmd, ACKs.menu_ack.value, _HDR_OP)
+
+    async def power_on(self) -> tuple[str, bool]:
+        """
+        Turns on PJ
+        """
+        return await self.exec_command(["power,on"])
+
+    async def power_off(self) -> tuple[str, bool]:
+        """
+        Turns off PJ
+        """
+        return await self.exec_command(["power,off"])
+
+    async def get_attribute(self, command: str) -> str:
+        """
+        Get the current state of an attribute like "picture_mode" -> user1
+
+        Returns "" if the query failed
+        """
+        return (await self.get_many([command]))[command]
+
+    async def get_many(self, commands: list[str]) -> dict[str, str]:
+        """
+        Query several attributes in one go, see JVCProjector.get_all_state
+
+        Returns a dict of attribute name -> state, "" for a query that failed
+        Raises ValueError for attributes with a raw value, like lamp_time
+        """
+        _check_named_states(commands)
+        async with self._lock:
+            return await self._query_many(commands)
+
+    async def _query_many(self, commands: list[str]) -> dict[str, str]:
+        """
+        get_many without the lock, the caller holds self._lock
+        """
+        states = {}
+        for command in commands:
+            ack, _ = _QUERIES[command]
+            msg, success = await self._do_command(
+                _REF_COMMANDS[command], ack.value, _HDR_REF
+            )
+            if not success:
+                states[command] = ""
+                continue
+            try:
+                states[command] = _decode_state(command, msg)
+            except KeyError:
+                self.logger.error("Attribute not found - %s", msg)
+                states[command] = ""
+
+        return states
+
+    async def refresh_all(
+        self, commands: tuple[str, ...] = _POLL_ATTRIBUTES
+    ) -> dict[str, str]:
+        """
+        Poll power and then every attribute in commands, for one status update
+
+        Both run under one lock hold, so nothing can change the power state in
+        between. Unless the projector is on the other attributes are not asked
+        for and come back as "", most queries just time out while it is off
+
+        Returns a dict of attribute name -> state, including power
+        Raises ValueError for attributes with a raw value, like lamp_time
+        """
+        queries = [command for command in commands if command != "power"]
+        _check_named_states(queries)
+        async with self._lock:
+            states = await self._query_many(["power"])
+            if states["power"] == _POWER_ON_NAME:
+                states.update(await self._query_many(queries))
+            else:
+                states.update(dict.fromkeys(queries, ""))
+
+        return states
+
+    async def is_on(self) -> bool:
+        """
+        True if the current state is on
+        """
+        return await self.get_attribute("power") == _POWER_ON_NAME
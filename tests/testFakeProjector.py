@@ -0,0 +1,275 @@
+import socket
+import threading
+import time
+import unittest
+from jvc_projector.jvc_projector import JVCProjector, AsyncJVCProjector
+
+# reference payloads the fake projector answers with, keyed by command
+PAYLOADS = {
+    b"PW": b"1",
+    b"MD": b"ILAFPJ -- -B5A3",
+    b"PMLL": b"0",
+    b"PMPM": b"0C",
+    b"PMLP": b"0",
+    b"IFSV": b"0300PJ",
+    b"IFLT": b"0100",
+    b"IFHR": b"1",
+    b"IP": b"6",
+}
+
+
+class FakeProjector:
+    """
+    Local socket server that speaks enough of the JVC protocol for tests
+
+    delay: command -> seconds to wait before replying
+    drop: commands that close the connection instead of replying, once each
+    wrong_ack: commands answered with a stray ack and response, once each
+    """
+
+    def __init__(self):
+        self.payloads = dict(PAYLOADS)
+        self.delay: dict[bytes, float] = {}
+        self.drop: set[bytes] = set()
+        self.wrong_ack: set[bytes] = set()
+        # every PJREQ and command frame received, in order
+        self.pj_reqs: list[bytes] = []
+        self.frames: list[bytes] = []
+        self.connections = 0
+        self._server = socket.create_server(("127.0.0.1", 0))
+        self.port = self._server.getsockname()[1]
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def close(self) -> None:
+        self._server.close()
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                return
+            self.connections += 1
+            threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    def _lookup(self, body: bytes, table) -> bytes:
+        # longest key wins, PMPM before PM
+        for key in sorted(table, key=len, reverse=True):
+            if body.startswith(key):
+                return key
+        return b""
+
+    def _handle(self, conn: socket.socket) -> None:
+        with conn:
+            conn.sendall(b"PJ_OK")
+            self.pj_reqs.append(conn.recv(100))
+            conn.sendall(b"PJACK")
+            buf = b""
+            while True:
+                try:
+                    data = conn.recv(1024)
+                except OSError:
+                    return
+                if not data:
+                    return
+                buf += data
+                while b"\n" in buf:
+                    frame, buf = buf.split(b"\n", 1)
+                    self.frames.append(frame + b"\n")
+                    if not self._reply(conn, frame[:1], frame[3:]):
+                        return
+
+    def _reply(self, conn: socket.socket, kind: bytes, body: bytes) -> bool:
+        if body in self.drop or body[:2] in self.drop:
+            self.drop.discard(body)
+            self.drop.discard(body[:2])
+            return False
+        delay = self.delay.get(self._lookup(body, self.delay))
+        if delay:
+            time.sleep(delay)
+        ack = body[:2]
+        if body in self.wrong_ack:
+            self.wrong_ack.discard(body)
+            ack = b"XX"
+        payload = self.payloads.get(self._lookup(body, self.payloads), b"0")
+        try:
+            conn.sendall(b"\x06\x89\x01" + ack + b"\n")
+            if kind == b"?":
+                conn.sendall(b"@\x89\x01" + ack + payload + b"\n")
+        except OSError:
+            return False
+        return True
+
+
+class TestFakeProjector(unittest.TestCase):
+    """
+    Test JVCProjector against the fake projector
+    """
+
+    def setUp(self):
+        self.pj = FakeProjector()
+        self.jvc = JVCProjector(
+            host="127.0.0.1", port=self.pj.port, password="abc", connect_timeout=1
+        )
+
+    def tearDown(self):
+        self.jvc.close_connection()
+        self.pj.close()
+
+    def test_handshake(self):
+        """Test the handshake sends the password and reads the model"""
+        self.assertTrue(self.jvc.open_connection())
+        self.assertEqual(self.pj.pj_reqs, [b"PJREQ_abc"])
+        self.assertEqual(self.jvc.model_family, "NZ7")
+
+    def test_model_lookup_dropped(self):
+        """Test the handshake fails if the model lookup drops the connection"""
+        self.pj.drop.add(b"MD")
+        self.assertFalse(self.jvc.open_connection())
+        self.assertIsNone(self.jvc.client)
+
+    def test_reference(self):
+        """Test reference responses are read and decoded"""
+        self.assertEqual(self.jvc.get_picture_mode(), "user1")
+        self.assertEqual(self.jvc.get_input_mode(), "hdmi1")
+        self.assertEqual(self.jvc.get_lamp_time(), 256)
+        self.assertEqual(self.jvc.get_software_version(), 3.0)
+        self.assertTrue(self.jvc.is_on())
+        # all on the one connection
+        self.assertEqual(self.pj.connections, 1)
+
+    def test_operation(self):
+        """Test operations are acked"""
+        self.assertEqual(self.jvc.power_on(), (b"\x06\x89\x01PW\n", True))
+        self.assertIn(b"!\x89\x01PW1\n", self.pj.frames)
+
+    def test_timeout(self):
+        """Test a late reply is never read as the reply to the next query"""
+        self.pj.delay[b"PMPM"] = 1.3
+        self.assertEqual(self.jvc.get_picture_mode(), "")
+        # sent before the late PM reply arrives, and acked with PM as well
+        self.assertEqual(self.jvc.get_laser_power(), "low")
+        self.assertEqual(self.jvc.get_low_latency_state(), "off")
+        # the timed out query is not retried, the next one reconnects
+        self.assertEqual(self.pj.frames.count(b"?\x89\x01PMPM\n"), 1)
+        self.assertEqual(self.pj.connections, 2)
+
+    def test_get_all_state(self):
+        """Test a batch decodes each state and blanks the unknown ones"""
+        self.pj.payloads[b"PMPM"] = b"ZZ"
+        self.assertEqual(
+            self.jvc.get_all_state(["power", "picture_mode", "input_mode"]),
+            {"power": "on", "picture_mode": "", "input_mode": "hdmi1"},
+        )
+        self.assertEqual(self.jvc._last_power_state[1], "on")
+
+    def test_get_all_state_off(self):
+        """Test a batch skips attributes that need power while off"""
+        self.pj.payloads[b"PW"] = b"0"
+        self.assertEqual(
+            self.jvc.get_all_state(["power", "hdr_data", "input_mode"]),
+            {"power": "off", "hdr_data": "", "input_mode": "hdmi1"},
+        )
+        self.assertNotIn(b"?\x89\x01IFHR\n", self.pj.frames)
+        self.assertRaises(ValueError, self.jvc.get_all_state, ["lamp_time"])
+
+    def test_get_all_state_cached(self):
+        """Test a batch reuses states cached within cache_ttl"""
+        self.jvc.cache_ttl = 60
+        self.assertEqual(self.jvc.get_picture_mode(), "user1")
+        self.assertEqual(
+            self.jvc.get_all_state(["picture_mode"]), {"picture_mode": "user1"}
+        )
+        self.assertEqual(self.pj.frames.count(b"?\x89\x01PMPM\n"), 1)
+
+    def test_wrong_ack(self):
+        """Test a stray reply does not misalign later reads"""
+        self.pj.wrong_ack.add(b"PMPM")
+        self.assertEqual(self.jvc.get_picture_mode(), "")
+        self.assertEqual(self.jvc.get_low_latency_state(), "off")
+        self.assertEqual(self.jvc.get_input_mode(), "hdmi1")
+
+    def test_reconnect(self):
+        """Test a dropped reference is retried on a new connection"""
+        self.assertEqual(self.jvc.get_input_mode(), "hdmi1")
+        self.pj.drop.add(b"PMPM")
+        self.assertEqual(self.jvc.get_picture_mode(), "user1")
+        self.assertEqual(self.pj.connections, 2)
+
+
+class TestAsyncFakeProjector(unittest.IsolatedAsyncioTestCase):
+    """
+    Test AsyncJVCProjector against the fake projector
+    """
+
+    def setUp(self):
+        self.pj = FakeProjector()
+        self.jvc = AsyncJVCProjector(
+            host="127.0.0.1", port=self.pj.port, password="abc", connect_timeout=1
+        )
+
+    async def asyncTearDown(self):
+        await self.jvc.close_connection()
+        self.pj.close()
+
+    async def test_handshake(self):
+        """Test the handshake sends the password and reads the model"""
+        self.assertTrue(await self.jvc.open_connection())
+        self.assertEqual(self.pj.pj_reqs, [b"PJREQ_abc"])
+        self.assertEqual(self.jvc.model_family, "NZ7")
+
+    async def test_model_lookup_dropped(self):
+        """Test the handshake fails if the model lookup drops the connection"""
+        self.pj.drop.add(b"MD")
+        self.assertFalse(await self.jvc.open_connection())
+
+    async def test_get_many(self):
+        """Test reference responses are read and decoded"""
+        self.assertEqual(
+            await self.jvc.get_many(["power", "picture_mode", "input_mode"]),
+            {"power": "on", "picture_mode": "user1", "input_mode": "hdmi1"},
+        )
+        self.assertTrue(await self.jvc.is_on())
+        with self.assertRaises(ValueError):
+            await self.jvc.get_many(["lamp_time", "get_software_version"])
+
+    async def test_exec_command(self):
+        """Test operations and remote emulation are acked"""
+        self.assertEqual(
+            await self.jvc.exec_command(["power, on"]), (b"\x06\x89\x01PW\n", True)
+        )
+        self.assertEqual(
+            await self.jvc.exec_command(["remote, 23"]), (b"\x06\x89\x01RC\n", True)
+        )
+        self.assertIn(b"!\x89\x01RC7323\n", self.pj.frames)
+
+    async def test_refresh_all(self):
+        """Test a full poll, and that only power is asked for while off"""
+        states = await self.jvc.refresh_all(("power", "picture_mode", "hdr_data"))
+        self.assertEqual(states["power"], "on")
+        self.assertEqual(states["picture_mode"], "user1")
+        self.assertEqual(len(self.pj.frames), 4)
+
+        self.pj.payloads[b"PW"] = b"0"
+        self.pj.frames.clear()
+        states = await self.jvc.refresh_all(("picture_mode", "hdr_data"))
+        self.assertEqual(states, {"power": "off", "picture_mode": "", "hdr_data": ""})
+        self.assertEqual(self.pj.frames, [b"?\x89\x01PW\n"])
+
+    async def test_wrong_ack(self):
+        """Test a stray reply does not misalign later reads"""
+        self.pj.wrong_ack.add(b"PMPM")
+        self.assertEqual(await self.jvc.get_attribute("picture_mode"), "")
+        self.assertEqual(await self.jvc.get_attribute("low_latency"), "off")
+        self.assertEqual(self.pj.connections, 2)
+
+    async def test_timeout(self):
+        """Test a timed out query reconnects for the next one"""
+        self.pj.delay[b"PMPM"] = 1.5
+        self.assertEqual(await self.jvc.get_attribute("picture_mode"), "")
+        self.assertEqual(await self.jvc.get_attribute("low_latency"), "off")
+        self.assertEqual(self.pj.connections, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
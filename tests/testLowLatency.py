@@ -1,9 +1,13 @@
 import unittest
+from unittest import mock
 import os
 from dotenv import load_dotenv
-from jvc_projector.jvc_projector import JVCProjector, Header
+from jvc_projector.jvc_projector import JVCProjector, Header, _response_payload
 import logging
+import socket
+import threading
 import time
+from jvc_projector.errors import ConnectionClosedError
 
 # Load .env
 load_dotenv()
@@ -80,6 +84,109 @@ class TestUnits(unittest.TestCase):
             Header.operation.value,
         )
 
+    def test_construct_command_cached(self):
+        """Test _construct_command reuses the cached frame"""
+        first, _ = self.jvc._construct_command("power, on", Header.operation.value)
+        second, _ = self.jvc._construct_command("power, on", Header.operation.value)
+        self.assertIs(first, second)
+
+    def test_response_payload(self):
+        """Test _response_payload slices off the headers and ack"""
+        self.assertEqual(_response_payload(b"@\x89\x01PMPM0C\n"), b"PM0C")
+        self.assertEqual(_response_payload(b"@\x89\x01IF0300PJ\n"), b"0300PJ")
+
+    def test_state_cache(self):
+        """Test cached states are only reused within cache_ttl"""
+        jvc = JVCProjector(host=host, cache_ttl=60)
+        jvc._cache_state("low_latency", b"@\x89\x01PMPM1\n")
+        self.assertEqual(jvc._cached_state("low_latency"), b"@\x89\x01PMPM1\n")
+
+        # a read that raced an operation is not cached
+        def read_during_operation(command, ack):
+            jvc._cache_generation += 1
+            return b"@\x89\x01PM0C\n"
+
+        jvc._do_reference_op = mock.Mock(side_effect=read_during_operation)
+        self.assertEqual(jvc.get_picture_mode(), "user1")
+        self.assertEqual(jvc._cached_state("picture_mode"), b"")
+        # caching is off by default
+        self.jvc._cache_state("low_latency", b"@\x89\x01PMPM1\n")
+        self.assertEqual(self.jvc._cached_state("low_latency"), b"")
+
+    def test_powered_down(self):
+        """Test a fresh standby power state skips queries that need power"""
+        jvc = JVCProjector(host=host)
+        jvc._do_reference_op = mock.Mock(return_value=b"@\x89\x01PW0\n")
+        self.assertEqual(jvc._get_power_state(), "off")
+        self.assertTrue(jvc._is_powered_down())
+        jvc._do_reference_op.reset_mock()
+        self.assertEqual(jvc.get_hdr_data(), "")
+        self.assertEqual(jvc.get_laser_value(), -1)
+        jvc._do_reference_op.assert_not_called()
+        # an old reading is not trusted
+        checked_at, state = jvc._last_power_state
+        jvc._last_power_state = (checked_at - 60, state)
+        self.assertFalse(jvc._is_powered_down())
+
+    def _socket_pair(self) -> tuple[JVCProjector, socket.socket]:
+        """Give a fresh JVCProjector one end of a socketpair as its client"""
+        jvc = JVCProjector(host=host, connect_timeout=0.5)
+        jvc.client, peer = socket.socketpair()
+        jvc.client.settimeout(jvc.connect_timeout)
+        self.addCleanup(jvc.client.close)
+        self.addCleanup(peer.close)
+        return jvc, peer
+
+    def test_recv_exactly(self):
+        """Test _recv_exactly joins short reads and fails on close or timeout"""
+        jvc, peer = self._socket_pair()
+        peer.sendall(b"\x06\x89")
+        threading.Timer(0.05, peer.sendall, (b"\x01PW\n",)).start()
+        self.assertEqual(jvc._recv_exactly(6), b"\x06\x89\x01PW\n")
+        peer.sendall(b"\x06\x89")
+        self.assertRaises(TimeoutError, jvc._recv_exactly, 6)
+        peer.close()
+        self.assertRaises(ConnectionClosedError, jvc._recv_exactly, 6)
+
+    def test_recv_reference(self):
+        """Test _recv_reference reads the ack and response together"""
+        jvc, peer = self._socket_pair()
+        peer.sendall(b"\x06\x89\x01PM\n@\x89\x01PM")
+        threading.Timer(0.05, peer.sendall, (b"0C\n",)).start()
+        self.assertEqual(
+            jvc._recv_reference(b"\x06\x89\x01PM\n"),
+            (b"\x06\x89\x01PM\n", b"@\x89\x01PM0C\n"),
+        )
+
+    def test_recv_reference_extra_frame(self):
+        """Test _recv_reference stops at the first footer after the ack"""
+        jvc, peer = self._socket_pair()
+        peer.sendall(b"\x06\x89\x01PM\n@\x89\x01PM0C\n\x06\x89\x01PM\n@\x89\x01PM1")
+        self.assertEqual(
+            jvc._recv_reference(b"\x06\x89\x01PM\n"),
+            (b"\x06\x89\x01PM\n", b"@\x89\x01PM0C\n"),
+        )
+        self.assertTrue(jvc._stale)
+
+    def test_wrong_ack_drained(self):
+        """Test a stray reply is drained before the next command"""
+        jvc, peer = self._socket_pair()
+        peer.sendall(b"\x06\x89\x01PW\n")
+        ack, payload = jvc._recv_reference(b"\x06\x89\x01PM\n")
+        self.assertEqual(
+            jvc._check_received_msg(
+                ack, b"\x06\x89\x01PM\n", Header.reference.value, payload
+            ),
+            b"",
+        )
+        self.assertTrue(jvc._stale)
+        peer.sendall(b"@\x89\x01PW1\n")
+        time.sleep(0.05)
+        jvc._drain()
+        self.assertFalse(jvc._stale)
+        peer.sendall(b"\x06\x89\x01PM\n")
+        self.assertEqual(jvc._recv_exactly(6), b"\x06\x89\x01PM\n")
+
     def test_sha_password(self):
         """Test _sha_password with known value"""
         password = self.jvc._password_to_sha256("1234567890")